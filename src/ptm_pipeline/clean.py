@@ -1,25 +1,105 @@
 """Clean up pipeline files created by init."""
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import os
 import shutil
+import subprocess
 
 from rich.console import Console
-from rich.prompt import Confirm
 
 
 console = Console()
 
 # Files and directories created by init
-PIPELINE_FILES = [
+PIPELINE_FILES = (
     "ptm_config.yaml",
     "Snakefile",
     "helpers.py",
     "Makefile",
-]
+)
 
-PIPELINE_DIRS = [
+PIPELINE_DIRS = (
     "src",
-]
+)
+
+# Directories with more top-level entries than this are counted with find(1)
+_FIND_THRESHOLD = 100
+
+
+def _count_files(path: Path) -> int:
+    """Count regular files below path without following symlinks.
+
+    Uses os.scandir so file types come from the directory listing
+    instead of one stat() per entry. Wide trees are handed to find(1).
+    """
+    try:
+        with os.scandir(path) as it:
+            top = list(it)
+    except OSError:
+        return 0
+
+    if len(top) > _FIND_THRESHOLD:
+        try:
+            result = subprocess.run(
+                ["find", str(path), "-type", "f", "-print0"],
+                capture_output=True,
+            )
+        except OSError:
+            pass  # no find(1): fall back to the Python walk
+        else:
+            # find exits nonzero after unreadable directories but still
+            # lists everything it could read, like the Python walk below
+            return result.stdout.count(b"\0")
+
+    count = 0
+    stack = []
+    for entry in top:
+        if entry.is_file(follow_symlinks=False):
+            count += 1
+        elif entry.is_dir(follow_symlinks=False):
+            stack.append(entry.path)
+
+    while stack:
+        # Best effort: unreadable subdirectories are skipped, as rglob did
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        try:
+            for entry in it:
+                if entry.is_file(follow_symlinks=False):
+                    count += 1
+                elif entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+        finally:
+            it.close()
+    return count
+
+
+def _fast_rmtree(path: Path) -> None:
+    """Remove a directory tree, preferring the system rm on POSIX.
+
+    rm -rf is much faster than shutil.rmtree on large trees. Failures
+    are raised as OSError so callers handle both paths the same way.
+    """
+    rm = shutil.which("rm") if os.name == "posix" else None
+    if rm is None:
+        shutil.rmtree(path)
+        return
+    try:
+        subprocess.run([rm, "-rf", "--", str(path)], check=True)
+    except subprocess.CalledProcessError as e:
+        raise OSError(f"rm exited with status {e.returncode}") from e
+
+
+def _run_removal(remove) -> OSError | None:
+    """Call a removal function, returning the OSError instead of raising."""
+    try:
+        remove()
+    except OSError as e:
+        return e
+    return None
 
 
 def get_files_to_remove(project_dir: Path) -> tuple[list[Path], list[Path]]:
@@ -28,20 +108,29 @@ def get_files_to_remove(project_dir: Path) -> tuple[list[Path], list[Path]]:
     Returns:
         Tuple of (files, directories) that exist and would be removed.
     """
-    files = []
-    dirs = []
+    # One directory listing answers every existence check
+    try:
+        with os.scandir(project_dir) as it:
+            entries = {e.name: e for e in it}
+    except FileNotFoundError:
+        return [], []
+
+    files = [
+        project_dir / name for name in PIPELINE_FILES
+        if name in entries and entries[name].is_file()
+    ]
+    dirs = [
+        project_dir / name for name in PIPELINE_DIRS
+        if name in entries and entries[name].is_dir(follow_symlinks=False)
+    ]
 
-    for filename in PIPELINE_FILES:
-        path = project_dir / filename
-        if path.exists():
-            files.append(path)
+    return files, dirs
 
-    for dirname in PIPELINE_DIRS:
-        path = project_dir / dirname
-        if path.exists() and path.is_dir():
-            dirs.append(path)
 
-    return files, dirs
+def _print_nothing_to_remove() -> None:
+    """Tell the user that no pipeline files were found."""
+    console.print("[yellow]No pipeline files found to remove.[/yellow]")
+    console.print("  (Looking for: ptm_config.yaml, Snakefile, helpers.py, Makefile, src/)")
 
 
 def clean_project(
@@ -63,23 +152,31 @@ def clean_project(
 
     console.print(f"\n[bold]Cleaning PTM pipeline from:[/bold] {project_dir}\n")
 
-    files, dirs = get_files_to_remove(project_dir)
-
-    if not files and not dirs:
-        console.print("[yellow]No pipeline files found to remove.[/yellow]")
-        console.print("  (Looking for: ptm_config.yaml, Snakefile, helpers.py, Makefile, src/)")
-        return True
-
-    # Show what will be removed
-    console.print("[bold]Files to remove:[/bold]")
-    for f in files:
-        console.print(f"  - {f.name}")
-
-    console.print("\n[bold]Directories to remove:[/bold]")
-    for d in dirs:
-        # Count files in directory
-        file_count = sum(1 for _ in d.rglob("*") if _.is_file())
-        console.print(f"  - {d.name}/ ({file_count} files)")
+    if force and not dry_run:
+        # Nothing to preview: attempt the removals and skip what is missing
+        files = [project_dir / filename for filename in PIPELINE_FILES]
+        dirs = [d for d in (project_dir / dirname for dirname in PIPELINE_DIRS) if d.is_dir()]
+    else:
+        files, dirs = get_files_to_remove(project_dir)
+
+        if not files and not dirs:
+            _print_nothing_to_remove()
+            return True
+
+        # Show what will be removed
+        console.print("[bold]Files to remove:[/bold]")
+        for f in files:
+            console.print(f"  - {f.name}")
+
+        console.print("\n[bold]Directories to remove:[/bold]")
+        for d in dirs:
+            # The count is informational only: keep dry runs to the top level
+            if dry_run:
+                entry_count = len(list(d.iterdir()))
+                console.print(f"  - {d.name}/ ({entry_count} entries)")
+            else:
+                file_count = _count_files(d)
+                console.print(f"  - {d.name}/ ({file_count} files)")
 
     if dry_run:
         console.print("\n[yellow]Dry run complete.[/yellow] No files were removed.")
@@ -87,29 +184,40 @@ def clean_project(
 
     # Confirm unless force
     if not force:
+        from rich.prompt import Confirm
+
         console.print()
         if not Confirm.ask("[red]Remove these files?[/red]", default=False):
             console.print("Cancelled.")
             return False
 
-    # Remove files
+    # Remove files and directories concurrently; report in submission order
+    tasks = [(f.name, lambda p=f: os.unlink(p)) for f in files]
+    tasks += [(f"{d.name}/", lambda p=d: _fast_rmtree(p)) for d in dirs]
+
+    with ThreadPoolExecutor(max_workers=min(8, len(tasks))) as executor:
+        outcomes = list(executor.map(_run_removal, (remove for _, remove in tasks)))
+
+    success = True
+    output_lines = []
+    for (label, _), error in zip(tasks, outcomes):
+        if error is None:
+            output_lines.append(f"  [red]Removed:[/red] {label}")
+        elif not isinstance(error, FileNotFoundError):
+            output_lines.append(f"  [red]Error removing {label}:[/red] {error}")
+            success = False
+
+    # With --force nothing was checked beforehand: only missing files
+    # means there was nothing to clean
+    if not output_lines:
+        _print_nothing_to_remove()
+        return True
+
     console.print("\n[bold]Removing files...[/bold]")
-    for f in files:
-        try:
-            f.unlink()
-            console.print(f"  [red]Removed:[/red] {f.name}")
-        except OSError as e:
-            console.print(f"  [red]Error removing {f.name}:[/red] {e}")
-            return False
+    console.print("\n".join(output_lines))
 
-    # Remove directories
-    for d in dirs:
-        try:
-            shutil.rmtree(d)
-            console.print(f"  [red]Removed:[/red] {d.name}/")
-        except OSError as e:
-            console.print(f"  [red]Error removing {d.name}/:[/red] {e}")
-            return False
+    if not success:
+        return False
 
     console.print("\n[green]Cleanup complete.[/green]")
     console.print("  DEA folders and other project data were preserved.")
@@ -1,18 +1,35 @@
 """CLI entry point for PTM pipeline."""
 
-from importlib.metadata import version
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import Annotated
 
 import cyclopts
-from rich.console import Console
 
-console = Console()
+
+@cache
+def _console():
+    """Shared rich Console, created on first use."""
+    from rich.console import Console
+    return Console()
+
+
+@lru_cache(maxsize=32)
+def _resolved(path: Path) -> Path:
+    """Resolve a directory argument once per process."""
+    return path.resolve()
+
+
+def _version() -> str:
+    """Installed package version, looked up only when --version is used."""
+    from importlib.metadata import version
+    return version("ptm-pipeline")
+
 
 app = cyclopts.App(
     name="ptm-pipeline",
     help="PTM Pipeline - Deploy phosphoproteomics analysis pipeline to new projects.",
-    version=version("ptm-pipeline"),
+    version=_version,
 )
 
 
@@ -33,6 +50,8 @@ def init(
     """
     from .init import init_project
 
+    console = _console()
+
     if not input_dir.exists():
         console.print(f"[red]Error:[/red] Input directory does not exist: {input_dir}")
         raise SystemExit(1)
@@ -69,6 +88,8 @@ def init_default(
     """
     from .init import init_project
 
+    console = _console()
+
     if not input_dir.exists():
         console.print(f"[red]Error:[/red] Input directory does not exist: {input_dir}")
         raise SystemExit(1)
@@ -102,9 +123,13 @@ def run(
         ptm-pipeline run data/PTM_FP_TMT/ --dry-run
         ptm-pipeline run data/PTM_FP_TMT/ -j4
     """
+    import os
     import subprocess
+    import sys
+
+    console = _console()
 
-    directory = directory.resolve()
+    directory = _resolved(directory)
 
     config_file = directory / "ptm_config.yaml"
     snakefile = directory / "Snakefile"
@@ -131,8 +156,18 @@ def run(
     console.print(f"[bold]Running pipeline in:[/bold] {directory}")
     console.print(f"[dim]$ {' '.join(cmd)}[/dim]\n")
 
-    result = subprocess.run(cmd, cwd=directory)
-    raise SystemExit(result.returncode)
+    if os.name == "nt":
+        result = subprocess.run(cmd, cwd=directory)
+        raise SystemExit(result.returncode)
+
+    # Nothing left to do after snakemake, so replace this process with it
+    sys.stdout.flush()
+    os.chdir(directory)
+    try:
+        os.execvp(cmd[0], cmd)
+    except FileNotFoundError:
+        console.print("[red]Error:[/red] snakemake not found. Is it installed and on PATH?")
+        raise SystemExit(1)
 
 
 @app.command
@@ -147,6 +182,8 @@ def validate(
     """
     from .validate import validate_project
 
+    console = _console()
+
     if not directory.exists():
         console.print(f"[red]Error:[/red] Directory does not exist: {directory}")
         raise SystemExit(1)
@@ -169,11 +206,13 @@ def update(
     """
     from .init import copy_template_files, get_template_dir
 
+    console = _console()
+
     if not directory.exists():
         console.print(f"[red]Error:[/red] Directory does not exist: {directory}")
         raise SystemExit(1)
 
-    directory = directory.resolve()
+    directory = _resolved(directory)
 
     # Check config exists (don't update uninitialized projects)
     config_file = directory / "ptm_config.yaml"
@@ -217,6 +256,8 @@ def clean(
     """
     from .clean import clean_project
 
+    console = _console()
+
     if not directory.exists():
         console.print(f"[red]Error:[/red] Directory does not exist: {directory}")
         raise SystemExit(1)
@@ -238,14 +279,22 @@ def info(
 
     Useful for debugging auto-discovery before running init.
     """
-    from .discover import find_all_dea_folders, find_annotation_file, parse_contrasts
+    from .discover import (
+        PHOSPHO_PATTERNS,
+        PROTEIN_PATTERNS,
+        find_all_dea_folders,
+        find_annotation_file,
+        parse_contrasts,
+    )
     from rich.table import Table
 
+    console = _console()
+
     if not directory.exists():
         console.print(f"[red]Error:[/red] Directory does not exist: {directory}")
         raise SystemExit(1)
 
-    directory = directory.resolve()
+    directory = _resolved(directory)
 
     console.print(f"\n[bold]Scanning:[/bold] {directory}\n")
 
@@ -253,50 +302,51 @@ def info(
 
     if not folders["phospho"] and not folders["protein"]:
         console.print("[yellow]No DEA folders found.[/yellow]")
-        console.print("[dim]Phospho patterns: DEA_*_WUphospho_*, DEA_*_WUcombined_*, DEA_*_*STY*[/dim]")
-        console.print("[dim]Protein patterns: DEA_*_WUprot_*, DEA_*_WUtotal_*[/dim]")
+        console.print(f"[dim]Phospho patterns: {', '.join(PHOSPHO_PATTERNS)}[/dim]")
+        console.print(f"[dim]Protein patterns: {', '.join(PROTEIN_PATTERNS)}[/dim]")
         return
 
     # Phospho folders
-    table = Table(title="Phospho DEA Folders")
-    table.add_column("#", style="dim")
-    table.add_column("Folder", style="green")
-    table.add_column("Annotation File")
-
-    for i, d in enumerate(folders["phospho"], 1):
-        annot = find_annotation_file(d)
-        annot_str = annot.name if annot else "[red]Not found[/red]"
-        table.add_row(str(i), d.name, annot_str)
-
+    first_annot = None
     if folders["phospho"]:
+        table = Table(title="Phospho DEA Folders")
+        table.add_column("#", style="dim")
+        table.add_column("Folder", style="green")
+        table.add_column("Annotation File")
+
+        for i, d in enumerate(folders["phospho"], 1):
+            annot = find_annotation_file(d)
+            if i == 1:
+                first_annot = annot
+            annot_str = annot.name if annot else "[red]Not found[/red]"
+            table.add_row(str(i), d.name, annot_str)
+
         console.print(table)
     else:
         console.print("[yellow]No phospho DEA folders found[/yellow]")
-        console.print("[dim]  Patterns: DEA_*_WUphospho_*, DEA_*_WUcombined_*, DEA_*_*STY*[/dim]")
+        console.print(f"[dim]  Patterns: {', '.join(PHOSPHO_PATTERNS)}[/dim]")
 
     console.print()
 
     # Protein folders
-    table = Table(title="Protein DEA Folders")
-    table.add_column("#", style="dim")
-    table.add_column("Folder", style="green")
+    if folders["protein"]:
+        table = Table(title="Protein DEA Folders")
+        table.add_column("#", style="dim")
+        table.add_column("Folder", style="green")
 
-    for i, d in enumerate(folders["protein"], 1):
-        table.add_row(str(i), d.name)
+        for i, d in enumerate(folders["protein"], 1):
+            table.add_row(str(i), d.name)
 
-    if folders["protein"]:
         console.print(table)
     else:
-        console.print("[yellow]No protein DEA folders found (DEA_*_WUprot_* or DEA_*_WUtotal_*)[/yellow]")
-
-    # Show contrasts from first phospho folder
-    if folders["phospho"]:
-        annot = find_annotation_file(folders["phospho"][0])
-        if annot:
-            contrasts = parse_contrasts(annot)
-            console.print(f"\n[bold]Contrasts from {annot.name}:[/bold]")
-            for c in contrasts:
-                console.print(f"  - {c}")
+        console.print(f"[yellow]No protein DEA folders found ({' or '.join(PROTEIN_PATTERNS)})[/yellow]")
+
+    # Show contrasts from first phospho folder (annotation found above)
+    if first_annot:
+        contrasts = parse_contrasts(first_annot)
+        console.print(f"\n[bold]Contrasts from {first_annot.name}:[/bold]")
+        for c in contrasts:
+            console.print(f"  - {c}")
 
 
 def main():
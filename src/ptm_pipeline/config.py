@@ -5,14 +5,62 @@ from datetime import date
 import os
 import yaml
 
+try:
+    from yaml import CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeDumper as _Dumper
+
+
+class _NoAliasDumper(_Dumper):
+    """YAML dumper that never emits anchors/aliases."""
+
+    def ignore_aliases(self, data):
+        return True
+
+
+# Analysis types with their configurations. Shared by every generated config;
+# the dict is only ever serialized, never mutated.
+_ANALYSES_TEMPLATE = {
+    "dpa": {
+        "sheet": "DPA",
+        "subdir": "PTM_DPA",
+        "xlsx_input": "Result_DPA.xlsx",
+        "stat_column": "statistic.site",
+    },
+    "dpu": {
+        "sheet": "DPU",
+        "subdir": "PTM_DPU",
+        "xlsx_input": "Result_DPU.xlsx",
+        "stat_column": "statistic.site",
+    },
+    "cf": {
+        "sheet": "CF",
+        "subdir": "PTM_CF_DPU",
+        "xlsx_input": "CorrectFirst_PTM_usage_results.xlsx",
+        "stat_column": "statistic.site",
+    },
+}
+
+# KinaseLib settings
+_KINASELIB_TEMPLATE = {
+    "repo": "git+https://github.com/wolski/kinase-library",
+    "kin_type": "ser_thr",
+    "threshold": 95,
+    "permutations": 1000,
+}
+
 
 def _make_relative_path(path: Path, base: Path) -> str:
     """Make path relative to base, handling paths outside base directory."""
-    try:
+    if path.is_relative_to(base):
         return str(path.relative_to(base))
-    except ValueError:
-        # Path is not under base, use os.path.relpath for "../" style paths
-        return os.path.relpath(path, base)
+    # Path is not under base, use os.path.relpath for "../" style paths
+    return os.path.relpath(path, base)
+
+
+def _default_dir_out() -> str:
+    """Date-stamped output directory name used when no name is given."""
+    return f"PTM_{date.today().strftime('%Y%m%d')}"
 
 
 def generate_config(
@@ -53,10 +101,7 @@ def generate_config(
         annot_path = str(annot_file)
 
     # Generate output directory name
-    if output_name:
-        dir_out = f"PTM_{output_name}"
-    else:
-        dir_out = f"PTM_{date.today().strftime('%Y%m%d')}"
+    dir_out = f"PTM_{output_name}" if output_name else _default_dir_out()
 
     return {
         # Source directory
@@ -77,26 +122,7 @@ def generate_config(
         "annot_file": annot_path,
 
         # Analysis types with their configurations
-        "analyses": {
-            "dpa": {
-                "sheet": "DPA",
-                "subdir": "PTM_DPA",
-                "xlsx_input": "Result_DPA.xlsx",
-                "stat_column": "statistic.site",
-            },
-            "dpu": {
-                "sheet": "DPU",
-                "subdir": "PTM_DPU",
-                "xlsx_input": "Result_DPU.xlsx",
-                "stat_column": "statistic.site",
-            },
-            "cf": {
-                "sheet": "CF",
-                "subdir": "PTM_CF_DPU",
-                "xlsx_input": "CorrectFirst_PTM_usage_results.xlsx",
-                "stat_column": "statistic.site",
-            },
-        },
+        "analyses": _ANALYSES_TEMPLATE,
 
         # Contrasts for MEA analysis
         "contrasts": contrasts,
@@ -109,12 +135,7 @@ def generate_config(
         },
 
         # KinaseLib settings
-        "kinaselib": {
-            "repo": "git+https://github.com/wolski/kinase-library",
-            "kin_type": "ser_thr",
-            "threshold": 95,
-            "permutations": 1000,
-        },
+        "kinaselib": _KINASELIB_TEMPLATE,
 
         # Thread settings
         "threads": {
@@ -133,12 +154,9 @@ def generate_config(
 def write_config(config: dict, output_path: Path) -> None:
     """Write configuration to YAML file."""
     with open(output_path, "w") as f:
-        # Custom representer to avoid aliases
-        yaml.Dumper.ignore_aliases = lambda *args: True
-        yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+        yaml.dump(config, f, Dumper=_NoAliasDumper, default_flow_style=False, sort_keys=False)
 
 
 def config_to_yaml_string(config: dict) -> str:
     """Convert config dict to YAML string for preview."""
-    yaml.Dumper.ignore_aliases = lambda *args: True
-    return yaml.dump(config, default_flow_style=False, sort_keys=False)
+    return yaml.dump(config, Dumper=_NoAliasDumper, default_flow_style=False, sort_keys=False)
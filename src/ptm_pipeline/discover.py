@@ -2,30 +2,134 @@
 
 from pathlib import Path
 import csv
+import fnmatch
+import functools
+import io
+import os
+import re
+
+
+# Phospho patterns - multiple naming conventions
+PHOSPHO_PATTERNS = ("DEA_*_WUphospho_*", "DEA_*_WUcombined_*", "DEA_*_*STY*")
+PROTEIN_PATTERNS = ("DEA_*_WUprot_*", "DEA_*_WUtotal_*")
+
+# Compiled once: one alternation per folder type
+_PHOSPHO_RE = re.compile("|".join(fnmatch.translate(p) for p in PHOSPHO_PATTERNS))
+_PROTEIN_RE = re.compile("|".join(fnmatch.translate(p) for p in PROTEIN_PATTERNS))
+
+
+def clear_cache() -> None:
+    """Forget cached directory scans and parsed files (e.g. between tests)."""
+    _scan_dea_folders.cache_clear()
+    _scan_annotation_file.cache_clear()
+    _parse_contrasts_file.cache_clear()
+
+
+def _mtime_ns(path: str) -> int | None:
+    """Modification time of path, used to invalidate cached scans.
+
+    Returns None if the path does not exist.
+    """
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+@functools.lru_cache(maxsize=32)
+def _scan_dea_folders(project_dir: str, mtime_ns: int) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Names of phospho and protein DEA folders in project_dir."""
+    # Single directory listing, classified against both pattern sets
+    phospho_names = []
+    protein_names = []
+    with os.scandir(project_dir) as it:
+        for entry in it:
+            name = entry.name
+            # Every pattern starts with DEA_; skip everything else cheaply
+            if not name.startswith("DEA_"):
+                continue
+            is_phospho = _PHOSPHO_RE.match(name) is not None
+            is_protein = _PROTEIN_RE.match(name) is not None
+            if not (is_phospho or is_protein) or not entry.is_dir():
+                continue
+            if is_phospho:
+                phospho_names.append(name)
+            if is_protein:
+                protein_names.append(name)
+
+    phospho_names.sort(reverse=True)
+    protein_names.sort(reverse=True)
+
+    return tuple(phospho_names), tuple(protein_names)
 
 
 def find_all_dea_folders(project_dir: Path) -> dict[str, list[Path]]:
     """Find all DEA folders, grouped by type.
 
+    Scans are cached per directory until its modification time changes.
+
     Returns dict with 'phospho' and 'protein' keys, each containing list of paths.
     """
-    # Phospho patterns - multiple naming conventions
-    phospho_dirs = set()
-    for pattern in ["DEA_*_WUphospho_*", "DEA_*_WUcombined_*", "DEA_*_*STY*"]:
-        phospho_dirs.update(d for d in project_dir.glob(pattern) if d.is_dir())
-    phospho_dirs = sorted(phospho_dirs, key=lambda x: x.name, reverse=True)
+    abs_dir = os.path.abspath(project_dir)
+    mtime_ns = _mtime_ns(abs_dir)
+    if mtime_ns is None:
+        return {"phospho": [], "protein": []}
+    phospho_names, protein_names = _scan_dea_folders(abs_dir, mtime_ns)
+    return {
+        "phospho": [project_dir / name for name in phospho_names],
+        "protein": [project_dir / name for name in protein_names],
+    }
+
+
+def _inputs_dirs(phospho_dea_dir: str) -> tuple[tuple[str, int], ...]:
+    """(name, st_mtime_ns) of each Inputs_* dir in phospho_dea_dir, by name.
+
+    Returns an empty tuple if phospho_dea_dir does not exist.
+    """
+    try:
+        with os.scandir(phospho_dea_dir) as it:
+            inputs_dirs = [
+                (e.name, e.stat().st_mtime_ns)
+                for e in it
+                if e.name.startswith("Inputs_") and e.is_dir()
+            ]
+    except FileNotFoundError:
+        return ()
+    # Directory order is arbitrary; check Inputs_* dirs by name
+    inputs_dirs.sort()
+    return tuple(inputs_dirs)
+
+
+@functools.lru_cache(maxsize=32)
+def _scan_annotation_file(
+    phospho_dea_dir: str, inputs_dirs: tuple[tuple[str, int], ...]
+) -> Path | None:
+    """Annotation file inside phospho_dea_dir, relative to it.
+
+    inputs_dirs comes from _inputs_dirs; their mtimes key the cache, so adding
+    or removing a file in any Inputs_* dir invalidates it.
+    """
+    for inputs_name, _ in inputs_dirs:
+        # One listing per Inputs_* dir, remembering the first match of each kind
+        annot = dataset = fallback = None
+        with os.scandir(os.path.join(phospho_dea_dir, inputs_name)) as it:
+            for entry in it:
+                name = entry.name
+                if fnmatch.fnmatchcase(name, "*_annot_*.tsv"):
+                    # Highest priority match; no need to read further
+                    annot = name
+                    break
+                elif dataset is None and fnmatch.fnmatchcase(name, "*_dataset*.tsv"):
+                    dataset = name
+                elif fallback is None and fnmatch.fnmatchcase(name, "dataset*.tsv"):
+                    fallback = name
 
-    # Protein patterns
-    protein_dirs = sorted(
-        [d for d in
-         list(project_dir.glob("DEA_*_WUprot_*")) +
-         list(project_dir.glob("DEA_*_WUtotal_*"))
-         if d.is_dir()],
-        key=lambda x: x.name,
-        reverse=True
-    )
+        # Standard annotation file first, then dataset file (alternative format)
+        found = annot or dataset or fallback
+        if found:
+            return Path(inputs_name, found)
 
-    return {"phospho": phospho_dirs, "protein": protein_dirs}
+    return None
 
 
 def find_annotation_file(phospho_dea_dir: Path) -> Path | None:
@@ -34,76 +138,108 @@ def find_annotation_file(phospho_dea_dir: Path) -> Path | None:
     Looks in Inputs_*/ subdirectory for:
     - *_annot_*.tsv (standard prolfqua format)
     - *_dataset*.tsv (alternative format with Group/Control columns)
+
+    Results are cached until one of the Inputs_* dirs changes.
     """
-    inputs_dirs = list(phospho_dea_dir.glob("Inputs_*"))
+    abs_dir = os.path.abspath(phospho_dea_dir)
+    inputs_dirs = _inputs_dirs(abs_dir)
     if not inputs_dirs:
         return None
+    found = _scan_annotation_file(abs_dir, inputs_dirs)
+    return phospho_dea_dir / found if found is not None else None
 
-    for inputs_dir in inputs_dirs:
-        # Try standard annotation file first
-        annot_files = list(inputs_dir.glob("*_annot_*.tsv"))
-        if annot_files:
-            return annot_files[0]
 
-        # Try dataset file (alternative format)
-        dataset_files = list(inputs_dir.glob("*_dataset*.tsv"))
-        if not dataset_files:
-            dataset_files = list(inputs_dir.glob("dataset*.tsv"))
-        if dataset_files:
-            return dataset_files[0]
+def _decode(value: bytes) -> str:
+    """Decode one unquoted TSV cell."""
+    return value.decode("utf-8", "replace")
 
-    return None
 
+@functools.lru_cache(maxsize=64)
+def _parse_contrasts_file(annot_file: str, mtime_ns: int, size: int) -> tuple[str, ...]:
+    """Sorted contrast names of annot_file; the stat fields key the cache."""
+    contrasts = set()
 
-def parse_contrasts(annot_file: Path) -> list[str]:
-    """Parse contrast names from annotation TSV file.
+    with open(annot_file, "rb") as f:
+        data = f.read()
 
-    Supports two formats:
-    1. Standard: has ContrastName column with explicit contrast names
-    2. Dataset: has Group and Control columns (T=treatment, C=control)
+    if b'"' in data:
+        # Quoted cells may hold tabs or newlines, which only csv splits right
+        text = data.decode("utf-8-sig", "replace")
+        reader = csv.reader(io.StringIO(text, newline=""), delimiter="\t")
+        header = next(reader, [])
+        rows = reader
+        decode = str
+    else:
+        # Annotation files written by prolfquapp are small, unquoted TSVs:
+        # split the raw bytes and decode only the cells used.
+        lines = data.split(b"\n")
+        header = [c.decode("utf-8", "replace") for c in lines[0].rstrip(b"\r").split(b"\t")]
+        header[0] = header[0].lstrip("\ufeff")
+        rows = (line.rstrip(b"\r").split(b"\t") for line in lines[1:] if line.strip())
+        decode = _decode
 
-    Returns unique non-NA contrast names.
-    """
-    contrasts = set()
+    # Check which format we have from the header alone
+    def column(name: str) -> int:
+        return header.index(name) if name in header else -1
 
-    with open(annot_file, newline="") as f:
-        reader = csv.DictReader(f, delimiter="\t")
-        rows = list(reader)
+    def cell(row: list, idx: int) -> str:
+        return decode(row[idx]) if idx < len(row) else ""
 
-        if not rows:
-            return []
+    cn_idx = column("ContrastName")
+    group_idx = column("Group")
+    control_idx = column("Control")
 
-        # Check which format we have
-        first_row = rows[0]
+    if cn_idx >= 0:
+        # Standard format with explicit contrast names. Files are usually
+        # sorted by group, so skip values equal to the previous row.
+        last = None
+        for row in rows:
+            # Compare undecoded cells; only new values are decoded
+            value = row[cn_idx] if cn_idx < len(row) else None
+            if value == last:
+                continue
+            last = value
+            contrast_name = decode(value).strip() if value is not None else ""
+            if contrast_name and contrast_name != "NA" and contrast_name.upper() != "NA":
+                contrasts.add(contrast_name)
 
-        if "ContrastName" in first_row:
-            # Standard format with explicit contrast names
-            for row in rows:
-                contrast_name = row.get("ContrastName", "").strip()
-                if contrast_name and contrast_name.upper() != "NA":
-                    contrasts.add(contrast_name)
+    elif group_idx >= 0 and control_idx >= 0:
+        # Dataset format: derive contrast from Group/Control
+        # Control='C' means control group, Control='T' means treatment
+        control_groups = set()
+        treatment_groups = set()
 
-        elif "Group" in first_row and "Control" in first_row:
-            # Dataset format: derive contrast from Group/Control
-            # Control='C' means control group, Control='T' means treatment
-            control_groups = set()
-            treatment_groups = set()
+        for row in rows:
+            group = cell(row, group_idx).strip()
+            control_flag = cell(row, control_idx).strip().upper()
 
-            for row in rows:
-                group = row.get("Group", "").strip()
-                control_flag = row.get("Control", "").strip().upper()
+            if control_flag == "C":
+                control_groups.add(group)
+            elif control_flag == "T":
+                treatment_groups.add(group)
 
-                if control_flag == "C":
-                    control_groups.add(group)
-                elif control_flag == "T":
-                    treatment_groups.add(group)
+        # Generate contrast names: treatment_vs_control
+        for treatment in sorted(treatment_groups):
+            for control in sorted(control_groups):
+                contrasts.add(f"{treatment}_vs_{control}")
 
-            # Generate contrast names: treatment_vs_control
-            for treatment in sorted(treatment_groups):
-                for control in sorted(control_groups):
-                    contrasts.add(f"{treatment}_vs_{control}")
+    return tuple(sorted(contrasts))
 
-    return sorted(contrasts)
+
+def parse_contrasts(annot_file: Path) -> list[str]:
+    """Parse contrast names from annotation TSV file.
+
+    Supports two formats:
+    1. Standard: has ContrastName column with explicit contrast names
+    2. Dataset: has Group and Control columns (T=treatment, C=control)
+
+    Results are cached per file until its modification time or size changes.
+
+    Returns unique non-NA contrast names.
+    """
+    path = os.path.abspath(annot_file)
+    st = os.stat(path)
+    return list(_parse_contrasts_file(path, st.st_mtime_ns, st.st_size))
 
 
 def get_experiment_name(phospho_dea_dir: Path) -> str:
@@ -113,15 +249,20 @@ def get_experiment_name(phospho_dea_dir: Path) -> str:
          DEA_20260113_WUcombined_STY_batch_vsn → STY_batch
     """
     name = phospho_dea_dir.name
-    parts = name.split("_")
-    if len(parts) >= 4:
-        # Find the WU-prefixed part (WUphospho, WUcombined, etc.)
+    if name.count("_") >= 3:
+        lname = name.lower()
+        # Find the WU-prefixed part (WUphospho, WUcombined, etc.);
+        # the suffix starts after the underscore that ends that part
         for keyword in ("phospho", "combined"):
-            idx = next((i for i, p in enumerate(parts) if keyword in p.lower()), -1)
-            if idx >= 0 and idx + 1 < len(parts):
-                suffix = "_".join(parts[idx + 1:])
-                # Strip trailing _vsn suffix
-                if suffix.endswith("_vsn"):
-                    suffix = suffix[:-4]
-                return suffix
+            pos = lname.find(keyword)
+            if pos < 0:
+                continue
+            sep = lname.find("_", pos)
+            if sep < 0:
+                continue
+            suffix = name[sep + 1:]
+            # Strip trailing _vsn suffix
+            if suffix.endswith("_vsn"):
+                suffix = suffix[:-4]
+            return suffix
     return "experiment"
@@ -1,14 +1,14 @@
 """Project initialization logic."""
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 from pathlib import Path
+import os
 import shutil
 
-from rich.console import Console
-from rich.prompt import Prompt, Confirm
-from rich.panel import Panel
-from rich.table import Table
-
 from .discover import (
+    PHOSPHO_PATTERNS,
+    PROTEIN_PATTERNS,
     find_all_dea_folders,
     find_annotation_file,
     parse_contrasts,
@@ -17,33 +17,31 @@ from .discover import (
 from .config import generate_config, write_config, config_to_yaml_string
 
 
-console = Console()
+@cache
+def _console():
+    """Shared rich Console, created on first use."""
+    from rich.console import Console
+    return Console()
 
 
+@cache
 def get_template_dir() -> Path:
-    """Get path to template directory from package data."""
-    try:
-        import sys
-        if sys.prefix != sys.base_prefix:
-            # In a virtual environment
-            template_path = Path(sys.prefix) / "share" / "ptm-pipeline" / "template"
-            if template_path.exists():
-                return template_path
-
-        # Try site-packages location
-        import ptm_pipeline
-        pkg_dir = Path(ptm_pipeline.__file__).parent
-        template_path = pkg_dir.parent.parent / "template"
-        if template_path.exists():
-            return template_path
-
-        # Development mode - look relative to package
-        template_path = pkg_dir.parent.parent.parent / "template"
-        if template_path.exists():
-            return template_path
-
-    except Exception:
-        pass
+    """Get path to template directory from package data.
+
+    The lookup is cached; call get_template_dir.cache_clear() to redo it.
+    """
+    from importlib.resources import files
+
+    # Installed package: template/ is shipped inside ptm_pipeline
+    pkg_dir = Path(str(files("ptm_pipeline")))
+    template_path = pkg_dir / "template"
+    if template_path.is_dir():
+        return template_path
+
+    # Development checkout: template/ sits at the repository root
+    template_path = pkg_dir.parent.parent / "template"
+    if template_path.is_dir():
+        return template_path
 
     raise FileNotFoundError(
         "Could not find template directory. "
@@ -76,18 +74,25 @@ def copy_template_files(project_dir: Path, dry_run: bool = False) -> list[str]:
 
     if src_dir.exists():
         if not dry_run:
-            if dst_src_dir.exists():
-                shutil.rmtree(dst_src_dir)
-            shutil.copytree(src_dir, dst_src_dir)
+            # Overwrite in place rather than deleting and rewriting the tree
+            shutil.copytree(src_dir, dst_src_dir, dirs_exist_ok=True)
 
-        for f in src_dir.rglob("*"):
-            if f.is_file():
-                rel_path = f.relative_to(template_dir)
-                copied_files.append(str(rel_path))
+        # os.walk classifies entries from the scandir results, no stat per file
+        for dirpath, _, filenames in os.walk(src_dir):
+            rel_dir = os.path.relpath(dirpath, template_dir)
+            copied_files.extend(os.path.join(rel_dir, f) for f in filenames)
 
     return copied_files
 
 
+def _load_annotation(phospho_dir: Path) -> tuple[Path | None, list[str]]:
+    """Find the annotation file of a phospho DEA folder and parse its contrasts."""
+    annot_file = find_annotation_file(phospho_dir)
+    if annot_file is None:
+        return None, []
+    return annot_file, parse_contrasts(annot_file)
+
+
 def init_project(
     project_dir: Path,
     input_dir: Path | None = None,
@@ -109,8 +114,15 @@ def init_project(
     Returns:
         True if initialization was successful
     """
-    project_dir = project_dir.resolve()
-    input_dir = input_dir.resolve() if input_dir else project_dir
+    from rich.prompt import Prompt, Confirm
+    from rich.panel import Panel
+    from rich.table import Table
+
+    console = _console()
+
+    # Absolute, not canonical: no need to readlink every path component
+    project_dir = Path(os.path.abspath(project_dir))
+    input_dir = Path(os.path.abspath(input_dir)) if input_dir else project_dir
 
     console.print(f"\n[bold]Initializing PTM pipeline in:[/bold] {project_dir}")
     if input_dir != project_dir:
@@ -135,61 +147,68 @@ def init_project(
 
     if not all_folders["phospho"]:
         console.print("[red]Error:[/red] No phospho DEA folder found")
-        console.print("  Expected patterns: DEA_*_WUphospho_*, DEA_*_WUcombined_*, DEA_*_*STY*")
+        console.print(f"  Expected patterns: {', '.join(PHOSPHO_PATTERNS)}")
         return False
 
     if not all_folders["protein"]:
-        console.print("[red]Error:[/red] No protein DEA folder found (DEA_*_WUprot_* or DEA_*_WUtotal_*)")
+        console.print(f"[red]Error:[/red] No protein DEA folder found ({' or '.join(PROTEIN_PATTERNS)})")
         return False
 
     # Select folders if multiple found
     phospho_dir = all_folders["phospho"][0]
     protein_dir = all_folders["protein"][0]
 
-    if len(all_folders["phospho"]) > 1 and not default:
-        console.print("\n[yellow]Multiple phospho DEA folders found:[/yellow]")
-        for i, d in enumerate(all_folders["phospho"]):
-            console.print(f"  {i + 1}. {d.name}")
-        choice = Prompt.ask(
-            "Select folder",
-            choices=[str(i + 1) for i in range(len(all_folders["phospho"]))],
-            default="1"
-        )
-        phospho_dir = all_folders["phospho"][int(choice) - 1]
-
-    if len(all_folders["protein"]) > 1 and not default:
-        console.print("\n[yellow]Multiple protein DEA folders found:[/yellow]")
-        for i, d in enumerate(all_folders["protein"]):
-            console.print(f"  {i + 1}. {d.name}")
-        choice = Prompt.ask(
-            "Select folder",
-            choices=[str(i + 1) for i in range(len(all_folders["protein"]))],
-            default="1"
-        )
-        protein_dir = all_folders["protein"][int(choice) - 1]
-
-    # Show selected folders
-    table = Table(title="Selected DEA Folders")
-    table.add_column("Type", style="cyan")
-    table.add_column("Folder", style="green")
-    table.add_row("Phospho", phospho_dir.name)
-    table.add_row("Protein", protein_dir.name)
-    console.print(table)
-
-    # Find annotation file
-    console.print("\n[bold]Looking for annotation file...[/bold]")
-    annot_file = find_annotation_file(phospho_dir)
+    # Read the default phospho folder's annotation in the background while
+    # folders are being selected; the result is reused if it stays selected
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        prefetched = executor.submit(_load_annotation, phospho_dir)
+
+        if len(all_folders["phospho"]) > 1 and not default:
+            console.print("\n[yellow]Multiple phospho DEA folders found:[/yellow]")
+            for i, d in enumerate(all_folders["phospho"]):
+                console.print(f"  {i + 1}. {d.name}")
+            choice = Prompt.ask(
+                "Select folder",
+                choices=[str(i + 1) for i in range(len(all_folders["phospho"]))],
+                default="1"
+            )
+            phospho_dir = all_folders["phospho"][int(choice) - 1]
+
+        if len(all_folders["protein"]) > 1 and not default:
+            console.print("\n[yellow]Multiple protein DEA folders found:[/yellow]")
+            for i, d in enumerate(all_folders["protein"]):
+                console.print(f"  {i + 1}. {d.name}")
+            choice = Prompt.ask(
+                "Select folder",
+                choices=[str(i + 1) for i in range(len(all_folders["protein"]))],
+                default="1"
+            )
+            protein_dir = all_folders["protein"][int(choice) - 1]
+
+        # Show selected folders
+        table = Table(title="Selected DEA Folders")
+        table.add_column("Type", style="cyan")
+        table.add_column("Folder", style="green")
+        table.add_row("Phospho", phospho_dir.name)
+        table.add_row("Protein", protein_dir.name)
+        console.print(table)
+
+        # Find annotation file
+        console.print("\n[bold]Looking for annotation file...[/bold]")
+        if phospho_dir == all_folders["phospho"][0]:
+            annot_file, contrasts = prefetched.result()
+        else:
+            annot_file, contrasts = _load_annotation(phospho_dir)
 
     if not annot_file:
         console.print("[red]Error:[/red] No annotation file found in phospho DEA folder")
         console.print("  Expected: Inputs_*/*_annot_*.tsv or Inputs_*/*_dataset*.tsv")
         return False
 
-    console.print(f"  Found: {annot_file.relative_to(input_dir)}")
+    console.print(f"  Found: {os.path.relpath(annot_file, input_dir)}")
 
-    # Parse contrasts
+    # Contrasts were parsed together with the annotation file
     console.print("\n[bold]Parsing contrasts...[/bold]")
-    contrasts = parse_contrasts(annot_file)
 
     if not contrasts:
         console.print("[yellow]Warning:[/yellow] No contrasts found in annotation file")
@@ -200,35 +219,48 @@ def init_project(
             console.print(f"    - {c}")
 
     # Get experiment name - suggest first contrast as default
-    if not name:
-        if contrasts and contrasts[0] != "contrast1":
-            default_name = contrasts[0]
-        else:
-            default_name = get_experiment_name(phospho_dir)
-        if default:
-            name = default_name
-            console.print(f"\n[bold]Experiment name:[/bold] {name}")
-        else:
-            console.print(f"\n[bold]Suggested experiment name:[/bold] {default_name}")
-            name = Prompt.ask("Experiment name", default=default_name)
-
-    # Get significance thresholds
-    if default:
-        fdr = 0.25
-        log2fc = 0.5
+    if name:
+        default_name = name
+    elif contrasts and contrasts[0] != "contrast1":
+        default_name = contrasts[0]
     else:
-        console.print("\n[bold]Significance thresholds for downstream analyses:[/bold]")
-        fdr = float(Prompt.ask("FDR threshold", default="0.25"))
-        log2fc = float(Prompt.ask("log2FC threshold", default="0.5"))
+        default_name = get_experiment_name(phospho_dir)
+
+    # Significance thresholds and analysis options
+    fdr = 0.25
+    log2fc = 0.5
+    max_fig = 10
+    run_kinase = True
 
-    # Analysis options
     if default:
-        max_fig = 10
-        run_kinase = True
+        if not name:
+            console.print(f"\n[bold]Experiment name:[/bold] {default_name}")
     else:
-        console.print("\n[bold]Analysis options:[/bold]")
-        max_fig = int(Prompt.ask("Max n-to-c plots per analysis", default="10"))
-        run_kinase = Confirm.ask("Run kinase activity analysis?", default=True)
+        # Show all settings at once; only ask field by field if declined
+        table = Table(title="Settings")
+        table.add_column("Setting", style="cyan")
+        table.add_column("Value", style="green")
+        table.add_row("Experiment name", default_name)
+        table.add_row("FDR threshold", str(fdr))
+        table.add_row("log2FC threshold", str(log2fc))
+        table.add_row("Max n-to-c plots per analysis", str(max_fig))
+        table.add_row("Run kinase activity analysis", "yes" if run_kinase else "no")
+        console.print()
+        console.print(table)
+
+        if not Confirm.ask("Use these settings?", default=True):
+            if not name:
+                default_name = Prompt.ask("Experiment name", default=default_name)
+
+            console.print("\n[bold]Significance thresholds for downstream analyses:[/bold]")
+            fdr = float(Prompt.ask("FDR threshold", default=str(fdr)))
+            log2fc = float(Prompt.ask("log2FC threshold", default=str(log2fc)))
+
+            console.print("\n[bold]Analysis options:[/bold]")
+            max_fig = int(Prompt.ask("Max n-to-c plots per analysis", default=str(max_fig)))
+            run_kinase = Confirm.ask("Run kinase activity analysis?", default=run_kinase)
+
+    name = default_name
 
     # Generate config
     console.print("\n[bold]Generating configuration...[/bold]")
@@ -1,17 +1,44 @@
 """Validation utilities for PTM pipeline."""
 
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
 from pathlib import Path
+import copy
+import functools
+import os
+import re
+import stat
 import subprocess
 import shutil
 from dataclasses import dataclass
 
 import yaml
 from rich.console import Console
+from rich.live import Live
 from rich.table import Table
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 
 console = Console()
 
+# Checks whose failure means the pipeline cannot run at all
+CRITICAL_CHECKS = ("ptm_config.yaml", "Snakefile", "Phospho DEA folder", "Protein DEA folder")
+
+# R packages required by the pipeline scripts
+R_PACKAGES = (
+    "tidyverse",
+    "readxl",
+    "writexl",
+    "arrow",
+    "prolfquapp",
+    "prophosqua",
+    "clusterProfiler",
+    "ggseqlogo",
+)
+
 
 @dataclass
 class ValidationResult:
@@ -21,16 +48,40 @@ class ValidationResult:
     message: str
 
 
+@functools.lru_cache(maxsize=32)
+def _parse_yaml(path: str, mtime_ns: int, size: int):
+    """Parsed YAML document at path; the stat fields key the cache."""
+    with open(path) as f:
+        return yaml.load(f, Loader=_SafeLoader)
+
+
+def _load_yaml_cached(path: Path):
+    """Load a YAML file, reusing the parse until the file changes.
+
+    Returns a deep copy, so callers may modify the result.
+    """
+    abs_path = os.path.abspath(path)
+    st = os.stat(abs_path)
+    return copy.deepcopy(_parse_yaml(abs_path, st.st_mtime_ns, st.st_size))
+
+
 def check_file_exists(path: Path, description: str) -> ValidationResult:
     """Check if a file exists."""
-    if path.exists():
-        return ValidationResult(description, True, str(path))
-    return ValidationResult(description, False, f"Not found: {path}")
+    try:
+        os.stat(path)
+    except OSError:
+        return ValidationResult(description, False, f"Not found: {path}")
+    return ValidationResult(description, True, str(path))
 
 
 def check_dir_exists(path: Path, description: str) -> ValidationResult:
     """Check if a directory exists."""
-    if path.exists() and path.is_dir():
+    # One stat answers both "exists" and "is a directory"
+    try:
+        is_dir = stat.S_ISDIR(os.stat(path).st_mode)
+    except OSError:
+        is_dir = False
+    if is_dir:
         return ValidationResult(description, True, str(path))
     return ValidationResult(description, False, f"Not found: {path}")
 
@@ -40,8 +91,9 @@ def check_r_package(package: str) -> ValidationResult:
     try:
         result = subprocess.run(
             ["Rscript", "-e", f"library({package})"],
-            capture_output=True,
-            text=True,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             timeout=30,
         )
         if result.returncode == 0:
@@ -53,20 +105,115 @@ def check_r_package(package: str) -> ValidationResult:
         return ValidationResult(f"R: {package}", False, "Rscript not found")
 
 
+def check_r_packages(packages: list[str]) -> list[ValidationResult]:
+    """Check several R packages with a single Rscript call.
+
+    R startup dominates the cost of a check, so all packages are tested
+    in one session that prints a tab-separated "package TRUE|FALSE" line each.
+    """
+    names = ", ".join(f"'{p}'" for p in packages)
+    script = (
+        f"for (p in c({names})) "
+        "cat(p, '\\t', requireNamespace(p, quietly = TRUE), '\\n', sep = '')"
+    )
+    try:
+        result = subprocess.run(
+            ["Rscript", "-e", script],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            timeout=120,
+        )
+    except subprocess.TimeoutExpired:
+        return [ValidationResult(f"R: {p}", False, "Timeout checking") for p in packages]
+    except FileNotFoundError:
+        return [ValidationResult(f"R: {p}", False, "Rscript not found") for p in packages]
+
+    installed = set()
+    for line in result.stdout.splitlines():
+        package, _, ok = line.partition("\t")
+        if ok.strip() == "TRUE":
+            installed.add(package)
+
+    return [
+        ValidationResult(f"R: {p}", True, "Installed")
+        if p in installed
+        else ValidationResult(f"R: {p}", False, "Not installed")
+        for p in packages
+    ]
+
+
+@functools.lru_cache(maxsize=64)
+def _which(command: str) -> str | None:
+    """shutil.which, remembered per command."""
+    return shutil.which(command)
+
+
 def check_command_exists(command: str, description: str) -> ValidationResult:
     """Check if a command is available in PATH."""
-    if shutil.which(command):
-        return ValidationResult(description, True, f"Found: {shutil.which(command)}")
+    location = _which(command)
+    if location:
+        return ValidationResult(description, True, f"Found: {location}")
     return ValidationResult(description, False, f"Command not found: {command}")
 
 
+def _uv_tool_name(tool_spec: str) -> str:
+    """Normalized package name of a uv tool spec.
+
+    E.g. git+https://github.com/wolski/kinase-library → kinase-library
+    """
+    name = tool_spec.rstrip("/").rsplit("/", 1)[-1]
+    name = name.split("@", 1)[0].removesuffix(".git")
+    name = re.split(r"[\[=<>!~;\s]", name, maxsplit=1)[0]
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def _uv_tool_dir() -> Path:
+    """Directory where uv installs tools (honours UV_TOOL_DIR and XDG_DATA_HOME)."""
+    if tool_dir := os.environ.get("UV_TOOL_DIR"):
+        return Path(tool_dir)
+    data_home = os.environ.get("XDG_DATA_HOME") or os.path.expanduser("~/.local/share")
+    return Path(data_home, "uv", "tools")
+
+
 def check_uv_tool(tool_spec: str) -> ValidationResult:
-    """Check if a uv tool can be accessed."""
+    """Check if a uv tool can be accessed.
+
+    Installed tools are recognised by their uv receipt file, or else via
+    `uv tool list`; only tools that are not installed are tried with
+    `uv tool run`, which may need to resolve and build the package first.
+    """
+    tool_name = _uv_tool_name(tool_spec)
+    if (_uv_tool_dir() / tool_name / "uv-receipt.toml").is_file():
+        return ValidationResult("kinase-library", True, "Installed as uv tool")
+
+    try:
+        listing = subprocess.run(
+            ["uv", "tool", "list"],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            timeout=5,
+        )
+        if listing.returncode == 0:
+            # Tool lines start at column 0, entry points are listed as "- name"
+            for line in listing.stdout.splitlines():
+                if line and not line[0].isspace() and not line.startswith("-"):
+                    if _uv_tool_name(line.split()[0]) == tool_name:
+                        return ValidationResult("kinase-library", True, "Installed as uv tool")
+    except subprocess.TimeoutExpired:
+        pass
+    except FileNotFoundError:
+        return ValidationResult("kinase-library", False, "uv not found")
+
     try:
         result = subprocess.run(
             ["uv", "tool", "run", "--from", tool_spec, "--help"],
-            capture_output=True,
-            text=True,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             timeout=60,
         )
         if result.returncode == 0:
@@ -78,29 +225,33 @@ def check_uv_tool(tool_spec: str) -> ValidationResult:
         return ValidationResult("kinase-library", False, "uv not found")
 
 
-def validate_project(project_dir: Path, quick: bool = False) -> bool:
+def validate_project(project_dir: Path, quick: bool = False, silent: bool = False) -> bool:
     """Validate project setup for PTM pipeline.
 
     Args:
         project_dir: Path to project directory
         quick: If True, skip slow checks (R packages, uv tools)
+        silent: If True, print nothing (for callers that only need the result)
 
     Returns:
         True if all critical checks pass
     """
-    project_dir = project_dir.resolve()
+    out = Console(quiet=True) if silent else console
+
+    # Absolute, not canonical: no need to readlink every path component
+    project_dir = Path(os.path.abspath(project_dir))
     results: list[ValidationResult] = []
 
-    console.print(f"\n[bold]Validating PTM pipeline setup in:[/bold] {project_dir}\n")
+    out.print(f"\n[bold]Validating PTM pipeline setup in:[/bold] {project_dir}\n")
 
     # Check config file
     config_file = project_dir / "ptm_config.yaml"
-    results.append(check_file_exists(config_file, "ptm_config.yaml"))
+    config_check = check_file_exists(config_file, "ptm_config.yaml")
+    results.append(config_check)
 
     config = None
-    if config_file.exists():
-        with open(config_file) as f:
-            config = yaml.safe_load(f)
+    if config_check.passed:
+        config = _load_yaml_cached(config_file)
 
     # Check Snakefile
     results.append(check_file_exists(project_dir / "Snakefile", "Snakefile"))
@@ -120,59 +271,85 @@ def validate_project(project_dir: Path, quick: bool = False) -> bool:
         results.append(check_file_exists(annot_file, "Annotation file"))
 
     # Check commands
+    rscript_ok = check_command_exists("Rscript", "Rscript")
+    uv_ok = check_command_exists("uv", "uv")
     results.append(check_command_exists("snakemake", "Snakemake"))
-    results.append(check_command_exists("Rscript", "Rscript"))
-    results.append(check_command_exists("uv", "uv"))
-
-    if not quick:
-        # Check R packages (slow)
-        console.print("[dim]Checking R packages (this may take a moment)...[/dim]")
-        r_packages = [
-            "tidyverse",
-            "readxl",
-            "writexl",
-            "arrow",
-            "prolfquapp",
-            "prophosqua",
-            "clusterProfiler",
-            "ggseqlogo",
-        ]
-        for pkg in r_packages:
-            results.append(check_r_package(pkg))
-
-        # Check kinase-library (slow)
-        console.print("[dim]Checking kinase-library access...[/dim]")
-        if config and "kinaselib" in config:
-            repo = config["kinaselib"].get("repo", "git+https://github.com/wolski/kinase-library")
-            results.append(check_uv_tool(repo))
-
-    # Display results
-    table = Table(title="Validation Results")
-    table.add_column("Check", style="cyan")
-    table.add_column("Status")
-    table.add_column("Details", style="dim")
-
-    critical_failed = False
-    for r in results:
-        status = "[green]PASS[/green]" if r.passed else "[red]FAIL[/red]"
-        table.add_row(r.name, status, r.message)
-        if not r.passed and r.name in ["ptm_config.yaml", "Snakefile", "Phospho DEA folder", "Protein DEA folder"]:
-            critical_failed = True
-
-    console.print(table)
+    results.append(rscript_ok)
+    results.append(uv_ok)
+
+    critical_failed = any(not r.passed and r.name in CRITICAL_CHECKS for r in results)
+
+    def build_table(rows: list[ValidationResult]) -> Table:
+        table = Table(title="Validation Results")
+        table.add_column("Check", style="cyan")
+        table.add_column("Status")
+        table.add_column("Details", style="dim")
+        for r in rows:
+            status = "[green]PASS[/green]" if r.passed else "[red]FAIL[/red]"
+            table.add_row(r.name, status, r.message)
+        return table
+
+    # The slow checks are independent subprocesses: run them side by side.
+    # slow keeps them in check order, each a Future or its known results.
+    slow: list = []
+
+    def slow_results() -> list[ValidationResult]:
+        rows = []
+        for item in slow:
+            if isinstance(item, Future):
+                if not item.done():
+                    continue
+                item = item.result()
+            rows.extend(item if isinstance(item, list) else [item])
+        return rows
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        if not quick and critical_failed:
+            out.print("[dim]Skipping R package and kinase-library checks: critical checks failed.[/dim]")
+        elif not quick:
+            # Check R packages (slow); pointless without Rscript
+            if rscript_ok.passed:
+                out.print("[dim]Checking R packages (this may take a moment)...[/dim]")
+                slow.append(executor.submit(check_r_packages, list(R_PACKAGES)))
+            else:
+                slow.append(ValidationResult("R packages", False, "Skipped: Rscript not found"))
+
+            # Check kinase-library (slow); pointless without uv
+            if config and "kinaselib" in config:
+                if uv_ok.passed:
+                    out.print("[dim]Checking kinase-library access...[/dim]")
+                    repo = config["kinaselib"].get("repo", "git+https://github.com/wolski/kinase-library")
+                    slow.append(executor.submit(check_uv_tool, repo))
+                else:
+                    slow.append(ValidationResult("kinase-library", False, "Skipped: uv not found"))
+
+        # On a terminal, show the table right away and fill in slow checks
+        # as they finish; rows always keep the check order
+        pending = [item for item in slow if isinstance(item, Future)]
+        streaming = bool(pending) and not silent and console.is_terminal
+        if streaming:
+            with Live(build_table(results), console=out) as live:
+                for _ in as_completed(pending):
+                    live.update(build_table(results + slow_results()))
+        else:
+            wait(pending)
+        results += slow_results()
+
+    if not streaming:
+        out.print(build_table(results))
 
     passed = sum(1 for r in results if r.passed)
     total = len(results)
 
-    console.print(f"\n[bold]Summary:[/bold] {passed}/{total} checks passed")
+    out.print(f"\n[bold]Summary:[/bold] {passed}/{total} checks passed")
 
     if critical_failed:
-        console.print("[red]Critical checks failed. Pipeline cannot run.[/red]")
+        out.print("[red]Critical checks failed. Pipeline cannot run.[/red]")
         return False
 
     if passed < total:
-        console.print("[yellow]Some checks failed. Pipeline may not work correctly.[/yellow]")
+        out.print("[yellow]Some checks failed. Pipeline may not work correctly.[/yellow]")
         return False
 
-    console.print("[green]All checks passed. Pipeline is ready to run![/green]")
+    out.print("[green]All checks passed. Pipeline is ready to run![/green]")
     return True
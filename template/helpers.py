@@ -4,14 +4,29 @@ This module contains utility functions for finding DEA directories
 and constructing file paths used by the Snakemake pipeline.
 """
 
-import glob
+import functools
+import os
+import string
 import subprocess
 
 
+@functools.lru_cache(maxsize=None)
+def _r_lib_paths() -> tuple[str, ...]:
+    """R library directories, in search order (one Rscript call per process)."""
+    result = subprocess.run(
+        ['Rscript', '-e', "cat(.libPaths(), sep='\\n')"],
+        capture_output=True,
+        text=True,
+    )
+    return tuple(line for line in result.stdout.splitlines() if line)
+
+
 def get_prophosqua_vignette(name: str) -> str:
     """Get path to a prophosqua vignette.
 
-    Looks for the template in the installed prophosqua package.
+    Looks for the template in the installed prophosqua package. Like
+    system.file(), uses the first R library that contains prophosqua;
+    R itself is only started once to list the libraries.
 
     Args:
         name: Vignette filename (e.g., "Analysis_seqlogo.Rmd")
@@ -22,20 +37,22 @@ def get_prophosqua_vignette(name: str) -> str:
     Raises:
         ValueError: If vignette not found in prophosqua
     """
-    cmd = [
-        'Rscript', '-e',
-        f'''
-        path <- system.file("application", "{name}", package="prophosqua")
-        cat(path)
-        '''
-    ]
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    path = result.stdout.strip()
-    if not path:
-        raise ValueError(f"Application template {name} not found in prophosqua package")
-    return path
+    for lib in _r_lib_paths():
+        package_dir = os.path.join(lib, "prophosqua")
+        if os.path.isfile(os.path.join(package_dir, "DESCRIPTION")):
+            path = os.path.join(package_dir, "application", name)
+            if os.path.exists(path):
+                return path
+            break
+    raise ValueError(f"Application template {name} not found in prophosqua package")
+
 
+_RMD_PATH_R_CODE = string.Template("""
+            rmd_path <- system.file('application', '$name', package='prophosqua')
+            if (rmd_path == '') stop('prophosqua application template not found: $name', call. = FALSE)""")
 
+
+@functools.lru_cache(maxsize=64)
 def rmd_path_r_code(name: str, dev_path: str = "") -> str:
     """Generate R code to find a prophosqua vignette path.
 
@@ -48,15 +65,32 @@ def rmd_path_r_code(name: str, dev_path: str = "") -> str:
     Returns:
         R code string that sets rmd_path variable
     """
-    return f"""
-            rmd_path <- system.file('application', '{name}', package='prophosqua')
-            if (rmd_path == '') stop('prophosqua application template not found: {name}', call. = FALSE)"""
+    return _RMD_PATH_R_CODE.substitute(name=name)
+
+
+@functools.lru_cache(maxsize=None)
+def _find_parquet(dea_dir: str, mtime_ns: int) -> str:
+    """Parquet path inside dea_dir; mtime_ns only keys the cache."""
+    # Only the Results_WU_ prefix is a wildcard: a prefix test replaces glob
+    try:
+        with os.scandir(dea_dir) as it:
+            for entry in it:
+                if entry.name.startswith("Results_WU_") and entry.is_dir():
+                    path = os.path.join(entry.path, "lfqdata_normalized.parquet")
+                    if os.path.exists(path):
+                        return path
+    except OSError:
+        # Missing or unreadable dea_dir: glob would have matched nothing
+        pass
+    raise ValueError(f"No parquet file found in {dea_dir}")
 
 
 def get_parquet_path(dea_dir: str) -> str:
     """Get parquet file path from a DEA directory.
 
     Finds the lfqdata_normalized.parquet file within the Results_WU_* subdirectory.
+    Snakemake calls this for many rules, so lookups are cached until the
+    modification time of dea_dir changes or the cached file disappears.
 
     Args:
         dea_dir: Path to DEA output directory (e.g., "DEA_setup/DEA_20260109_WUphospho_SHP2_vsn")
@@ -67,11 +101,16 @@ def get_parquet_path(dea_dir: str) -> str:
     Raises:
         ValueError: If no parquet file is found
     """
-    pattern = f"{dea_dir}/Results_WU_*/lfqdata_normalized.parquet"
-    matches = glob.glob(pattern)
-    if not matches:
-        raise ValueError(f"No parquet file found in {dea_dir}")
-    return matches[0]
+    try:
+        mtime_ns = os.stat(dea_dir).st_mtime_ns
+    except OSError:
+        mtime_ns = 0
+    path = _find_parquet(dea_dir, mtime_ns)
+    if not os.path.exists(path):
+        # Removed inside Results_WU_*, which leaves dea_dir's mtime unchanged
+        _find_parquet.cache_clear()
+        path = _find_parquet(dea_dir, mtime_ns)
+    return path
 
 
 def build_analysis_lookups(dir_out: str, analyses_config: dict) -> dict:
@@ -89,10 +128,24 @@ def build_analysis_lookups(dir_out: str, analyses_config: dict) -> dict:
         - xlsx_inputs: Dict mapping analysis -> input Excel filename
         - stat_columns: Dict mapping analysis -> statistic column name
     """
+    # Fill all lookups in a single pass over the analyses
+    base = dir_out.rstrip("/") + "/"
+    types = []
+    dirs = {}
+    sheets = {}
+    xlsx_inputs = {}
+    stat_columns = {}
+    for k, v in analyses_config.items():
+        types.append(k)
+        dirs[k] = base + v["subdir"]
+        sheets[k] = v["sheet"]
+        xlsx_inputs[k] = v["xlsx_input"]
+        stat_columns[k] = v["stat_column"]
+
     return {
-        "types": list(analyses_config.keys()),
-        "dirs": {k: f"{dir_out}/{v['subdir']}" for k, v in analyses_config.items()},
-        "sheets": {k: v["sheet"] for k, v in analyses_config.items()},
-        "xlsx_inputs": {k: v["xlsx_input"] for k, v in analyses_config.items()},
-        "stat_columns": {k: v["stat_column"] for k, v in analyses_config.items()},
+        "types": types,
+        "dirs": dirs,
+        "sheets": sheets,
+        "xlsx_inputs": xlsx_inputs,
+        "stat_columns": stat_columns,
     }
@@ -0,0 +1,67 @@
+"""Subsetting configurations for all test datasets.
+
+Keys are the names of the generated datasets under tests/data/.
+Used by create_all.py and the individual create_test_*.py scripts.
+"""
+
+from pathlib import Path
+
+BASE = Path(__file__).parent
+TESTS_DATA = BASE.parent / "tests" / "data"
+
+ALL_CONFIGS = {
+    # From PTM_example_analysis_v2: 2 contrasts
+    "FP_TMT_example": {
+        "seed": 42,
+        "src_dir": BASE / "PTM_example_analysis_v2",
+        "out_dir": TESTS_DATA / "FP_TMT_example",
+        "phospho_dea": "DEA_20260209_WUphospho_STY_vsn",
+        "protein_dea": "DEA_20260209_WUtotal_proteome_vsn",
+        "phospho_res": "Results_WU_phospho_STY",
+        "protein_res": "Results_WU_total_proteome",
+        "phospho_inp": "Inputs_WU_phospho_STY",
+        "protein_inp": "Inputs_WU_total_proteome",
+        "phospho_xlsx": "DE_WUphospho_STY.xlsx",
+        "protein_xlsx": "DE_WUtotal_proteome.xlsx",
+        "phospho_annot": "dataset_with_contrasts.tsv",
+        "protein_annot": "dataset_with_contrasts.tsv",
+        "keep_contrasts": ["KO_vs_WT", "KO_vs_WT_at_Early"],
+        "n_phospho": 1500,
+    },
+    # From o40094_Fabienne: 2 contrasts
+    "BGS_Spectronaut_DIA_example": {
+        "seed": 42,
+        "src_dir": BASE / "o40094_Fabienne",
+        "out_dir": TESTS_DATA / "BGS_Spectronaut_DIA_example",
+        "phospho_dea": "DEA_20260109_WUphospho_ERK_vsn",
+        "protein_dea": "DEA_20260109_WUprot_ERK_vsn",
+        "phospho_res": "Results_WU_phospho_ERK",
+        "protein_res": "Results_WU_prot_ERK",
+        "phospho_inp": "Inputs_WU_phospho_ERK",
+        "protein_inp": "Inputs_WU_prot_ERK",
+        "phospho_xlsx": "DE_WUphospho_ERK.xlsx",
+        "protein_xlsx": "DE_WUprot_ERK.xlsx",
+        "phospho_annot": "phospho_annot_ERK_RUX.tsv",
+        "protein_annot": "prot_annot_ERK_RUX.tsv",
+        "keep_contrasts": ["no_ERK_vs_ERK", "no_ERK_vs_ERK_at_NoRux"],
+        "n_phospho": 1500,
+    },
+    # From p40060_DanielGao: single contrast 42C_vs_37C
+    "FP_LFQ_example": {
+        "seed": 42,
+        "src_dir": BASE / "p40060_DanielGao",
+        "out_dir": TESTS_DATA / "FP_LFQ_example",
+        "phospho_dea": "DEA_20260113_WUcombined_STY_batch_vsn",
+        "protein_dea": "DEA_20260113_WUtotal_proteome_batch_vsn",
+        "phospho_res": "Results_WU_combined_STY_batch",
+        "protein_res": "Results_WU_total_proteome_batch",
+        "phospho_inp": "Inputs_WU_combined_STY_batch",
+        "protein_inp": "Inputs_WU_total_proteome_batch",
+        "phospho_xlsx": "DE_WUcombined_STY_batch.xlsx",
+        "protein_xlsx": "DE_WUtotal_proteome_batch.xlsx",
+        "phospho_annot": "combined_sty_dataset_with_batch.tsv",
+        "protein_annot": "dataset_with_batch.tsv",
+        "keep_contrasts": ["42C_vs_37C"],
+        "n_phospho": 1500,
+    },
+}
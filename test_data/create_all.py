@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.10"
+# dependencies = ["openpyxl", "pyarrow"]
+# ///
+"""Generate all test datasets with a single command.
+
+Runs the subsetting for every entry in configs.ALL_CONFIGS. The datasets
+are independent, so they are generated in parallel, one process each
+(progress output of the datasets is interleaved).
+
+Usage:
+    cd test_data
+    uv run create_all.py
+"""
+
+import multiprocessing
+import os
+
+from configs import ALL_CONFIGS
+from subset_utils import run_subset
+
+if __name__ == "__main__":
+    processes = min(len(ALL_CONFIGS), os.cpu_count() or 1)
+    with multiprocessing.Pool(processes=processes) as pool:
+        pool.map(run_subset, ALL_CONFIGS.values())
@@ -5,13 +5,18 @@ annotation files into small subsets suitable for CI testing.
 """
 
 import csv
+import os
 import random
 import shutil
-from collections import Counter
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import filterfalse
+from operator import itemgetter
 from pathlib import Path
 
 import openpyxl
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.parquet as pq
 
 
@@ -19,17 +24,50 @@ import pyarrow.parquet as pq
 # Low-level helpers
 # ---------------------------------------------------------------------------
 
+# Spellings of a true REV/CON flag in DEA workbooks
+_TRUE_VALUES = frozenset((True, "True", "TRUE"))
+
+
+def _prefetch(*paths: Path) -> None:
+    """Ask the OS to start reading files into the page cache (Linux only)."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+
+
+def _header_index(headers: list) -> dict:
+    """Map column name -> position, keeping the first match like headers.index()."""
+    idx = {}
+    for i, h in enumerate(headers):
+        idx.setdefault(h, i)
+    return idx
+
+
 def read_xlsx_sheet(wb: openpyxl.Workbook, sheet_name: str) -> tuple[list, list[list]]:
     """Read a sheet into (headers, rows) where rows is list of lists."""
-    ws = wb[sheet_name]
-    all_rows = list(ws.iter_rows(values_only=True))
-    if not all_rows:
-        return [], []
-    return list(all_rows[0]), [list(r) for r in all_rows[1:]]
+    # Single streamed pass: header tuple first, then the data rows
+    rows = wb[sheet_name].values
+    headers = list(next(rows, ()))
+    return headers, [list(r) for r in rows]
+
+
+def load_all_sheets(wb: openpyxl.Workbook) -> dict[str, tuple[list, list[list]]]:
+    """Read every sheet of a workbook into {sheet_name: (headers, rows)}."""
+    return {name: read_xlsx_sheet(wb, name) for name in wb.sheetnames}
 
 
 def write_xlsx(sheets: dict[str, tuple[list, list[list]]], output_path: Path):
     """Write {sheet_name: (headers, rows)} to xlsx."""
+    # Not write_only=True: write-only sheets omit the <dimension> element, so
+    # read-only readers would get rows without their trailing empty cells
     wb = openpyxl.Workbook()
     first = True
     for name, (headers, rows) in sheets.items():
@@ -63,70 +101,73 @@ def stratified_sample(items_by_group: dict[str, list], total_n: int) -> list:
 # ---------------------------------------------------------------------------
 
 def select_phosphosites(
-    phospho_wb: openpyxl.Workbook, n_phospho: int, keep_contrasts: list[str],
+    phospho_sheets: dict[str, tuple[list, list[list]]], n_phospho: int, keep_contrasts: list[str],
 ) -> tuple[set, set]:
     """Select n_phospho sites starting from diff_exp_analysis (long format).
 
     Strategy:
-      1. Filter diff_exp_analysis to keep_contrasts
-      2. Pivot: site -> {contrast: FDR} to see which sites have data in which contrasts
-      3. Pick n_complete sites present in ALL contrasts (non-NA FDR)
-      4. Pick n_partial sites present in only SOME contrasts (split evenly)
-      5. Filter to valid sites (no REV/CON, valid SequenceWindow)
+      1. Find valid sites in diff_exp_analysis_wide (no REV/CON, valid SequenceWindow)
+      2. Filter diff_exp_analysis to valid sites and keep_contrasts
+      3. Pivot: site -> {contrast: FDR} to see which sites have data in which contrasts
+      4. Pick n_complete sites present in ALL contrasts (non-NA FDR)
+      5. Pick n_partial sites present in only SOME contrasts (split evenly)
 
     Returns (keep_sites, keep_protein_ids).
     """
-    # Read diff_exp_analysis (long: one row per site x contrast)
-    headers, rows = read_xlsx_sheet(phospho_wb, "diff_exp_analysis")
-    site_idx = headers.index("site")
-    contrast_idx = headers.index("contrast")
-    fdr_idx = headers.index("FDR")
-
-    # Build site -> set of contrasts with non-NA FDR
-    site_contrasts: dict[str, set] = {}
-    for row in rows:
-        contrast = row[contrast_idx]
-        if contrast not in keep_contrasts:
-            continue
-        site = row[site_idx]
-        fdr = row[fdr_idx]
-        site_contrasts.setdefault(site, set())
-        if fdr is not None:
-            site_contrasts[site].add(contrast)
-
-    # Read wide sheet for validation (REV, CON, SequenceWindow, modAA, protein_Id)
-    w_headers, w_rows = read_xlsx_sheet(phospho_wb, "diff_exp_analysis_wide")
-    w_site_idx = w_headers.index("site")
-    w_rev_idx = w_headers.index("REV")
-    w_con_idx = w_headers.index("CON")
-    w_sw_idx = w_headers.index("SequenceWindow")
-    w_modaa_idx = w_headers.index("modAA")
-    w_prot_idx = w_headers.index("protein_Id")
+    # Read wide sheet first for validation (REV, CON, SequenceWindow, modAA, protein_Id)
+    w_headers, w_rows = phospho_sheets["diff_exp_analysis_wide"]
+    w_col = _header_index(w_headers)
+    w_site_idx = w_col["site"]
+    w_rev_idx = w_col["REV"]
+    w_con_idx = w_col["CON"]
+    w_sw_idx = w_col["SequenceWindow"]
+    w_modaa_idx = w_col["modAA"]
+    w_prot_idx = w_col["protein_Id"]
 
     # Build site metadata from wide sheet
     site_meta: dict[str, dict] = {}
     for row in w_rows:
-        site = row[w_site_idx]
-        if row[w_rev_idx] in (True, "True", "TRUE"):
-            continue
-        if row[w_con_idx] in (True, "True", "TRUE"):
+        if row[w_rev_idx] in _TRUE_VALUES or row[w_con_idx] in _TRUE_VALUES:
             continue
         sw = row[w_sw_idx]
-        if not sw or str(sw) == "None" or len(str(sw)) < 7:
+        if sw is None:
             continue
-        site_meta[site] = {
+        sw = str(sw)
+        if sw == "None" or len(sw) < 7:
+            continue
+        site_meta[row[w_site_idx]] = {
             "modAA": str(row[w_modaa_idx]),
             "protein_Id": row[w_prot_idx],
         }
 
+    # Read diff_exp_analysis (long: one row per site x contrast)
+    headers, rows = phospho_sheets["diff_exp_analysis"]
+    col = _header_index(headers)
+    site_idx = col["site"]
+    contrast_idx = col["contrast"]
+    fdr_idx = col["FDR"]
+
+    # Build site -> set of contrasts with non-NA FDR, for valid sites only
+    contrast_set = frozenset(keep_contrasts)
+    site_contrasts: defaultdict[str, set] = defaultdict(set)
+    for row in rows:
+        contrast = row[contrast_idx]
+        if contrast not in contrast_set:
+            continue
+        site = row[site_idx]
+        if site not in site_meta:
+            continue  # skip REV/CON/bad SequenceWindow
+        # Index before the FDR test: sites keep their first-seen order
+        contrasts = site_contrasts[site]
+        if row[fdr_idx] is not None:
+            contrasts.add(contrast)
+
     # Split into complete (all contrasts) vs partial
     n_contrasts = len(keep_contrasts)
     complete_sites = []
     partial_sites: dict[str, list] = {c: [] for c in keep_contrasts}
 
     for site, contrasts in site_contrasts.items():
-        if site not in site_meta:
-            continue  # skip REV/CON/bad SequenceWindow
         if len(contrasts) == n_contrasts:
             complete_sites.append(site)
         else:
@@ -146,15 +187,21 @@ def select_phosphosites(
     # Add partial sites, split evenly per contrast
     n_per_contrast = max(1, n_partial // n_contrasts)
     for c, sites in partial_sites.items():
-        available = [s for s in sites if s not in selected_sites]
+        # Order-preserving (unlike a set difference), so the seeded sample
+        # does not depend on string hashing
+        available = list(filterfalse(selected_sites.__contains__, sites))
         n_pick = min(n_per_contrast, len(available))
         if n_pick > 0:
             selected_sites.update(random.sample(available, n_pick))
 
-    keep_proteins = {site_meta[s]["protein_Id"] for s in selected_sites}
+    # Collect proteins and the modAA distribution in one pass
+    keep_proteins = set()
+    modaa_sel: defaultdict[str, int] = defaultdict(int)
+    for s in selected_sites:
+        meta = site_meta[s]
+        keep_proteins.add(meta["protein_Id"])
+        modaa_sel[meta["modAA"]] += 1
 
-    # Report modAA distribution
-    modaa_sel = Counter(site_meta[s]["modAA"] for s in selected_sites)
     n_actual_partial = len(selected_sites) - n_complete
     print(f"Selected {len(selected_sites)} phosphosites from {len(keep_proteins)} proteins")
     print(f"  {n_complete} complete + {n_actual_partial} partial")
@@ -164,10 +211,10 @@ def select_phosphosites(
 
 
 def select_proteins(
-    protein_wb: openpyxl.Workbook, phospho_protein_ids: set,
+    protein_sheets: dict[str, tuple[list, list[list]]], phospho_protein_ids: set,
 ) -> set:
     """Select proteins: all that match the phospho protein IDs."""
-    headers, rows = read_xlsx_sheet(protein_wb, "diff_exp_analysis_wide")
+    headers, rows = protein_sheets["diff_exp_analysis_wide"]
     prot_idx = headers.index("protein_Id")
     all_protein_set = {row[prot_idx] for row in rows}
 
@@ -182,21 +229,50 @@ def select_proteins(
 # XLSX filtering
 # ---------------------------------------------------------------------------
 
-def _update_summary(sheets: dict) -> None:
-    """Recompute the summary sheet based on filtered diff_exp_analysis_wide."""
-    hdrs = sheets["diff_exp_analysis_wide"][0]
-    data = sheets["diff_exp_analysis_wide"][1]
-    n_total = len(data)
-    rev_idx = hdrs.index("REV") if "REV" in hdrs else None
-    con_idx = hdrs.index("CON") if "CON" in hdrs else None
-    rev_count = sum(
-        1 for r in data
-        if rev_idx is not None and r[rev_idx] in (True, "True", "TRUE")
-    ) if rev_idx is not None else 0
-    con_count = sum(
-        1 for r in data
-        if con_idx is not None and r[con_idx] in (True, "True", "TRUE")
-    ) if con_idx is not None else 0
+# Sheets with one row per site/protein, filtered on the id column alone
+# (diff_exp_analysis_wide is handled by _filter_wide, which also counts decoys)
+ID_FILTERED_SHEETS = frozenset({
+    "normalized_abundances",
+    "raw_abundances_matrix",
+    "normalized_abundances_matrix",
+    "missing_information",
+    "stats_normalized",
+    "stats_normalized_wide",
+    "stats_raw",
+    "stats_raw_wide",
+})
+
+
+def _filter_wide(
+    headers: list, rows: list[list], id_col: str, keep_ids: set,
+) -> tuple[list[list], int, int]:
+    """Filter diff_exp_analysis_wide on id_col, counting kept REV and CON rows.
+
+    Returns (filtered_rows, rev_count, con_count) for _update_summary.
+    """
+    col = _header_index(headers)
+    id_idx = col[id_col]
+    rev_idx = col.get("REV")
+    con_idx = col.get("CON")
+    filtered = []
+    rev_count = con_count = 0
+    for r in rows:
+        if r[id_idx] not in keep_ids:
+            continue
+        filtered.append(r)
+        if rev_idx is not None and r[rev_idx] in _TRUE_VALUES:
+            rev_count += 1
+        if con_idx is not None and r[con_idx] in _TRUE_VALUES:
+            con_count += 1
+    return filtered, rev_count, con_count
+
+
+def _update_summary(sheets: dict, rev_count: int, con_count: int) -> None:
+    """Recompute the summary sheet based on filtered diff_exp_analysis_wide.
+
+    REV/CON counts come from _filter_wide, which saw the rows while filtering.
+    """
+    n_total = len(sheets["diff_exp_analysis_wide"][1])
     pct_con = round(100 * con_count / n_total, 2) if n_total else 0
     pct_rev = round(100 * rev_count / n_total, 2) if n_total else 0
     sheets["summary"] = (
@@ -207,13 +283,14 @@ def _update_summary(sheets: dict) -> None:
 
 
 def filter_phospho_xlsx(
-    wb: openpyxl.Workbook, keep_sites: set, keep_contrasts: list[str]
+    all_sheets: dict[str, tuple[list, list[list]]], keep_sites: set, keep_contrasts: list[str]
 ) -> dict[str, tuple[list, list[list]]]:
     """Filter all phospho xlsx sheets."""
+    contrast_set = frozenset(keep_contrasts)
     sheets = {}
+    rev_count = con_count = 0
 
-    for sheet_name in wb.sheetnames:
-        headers, rows = read_xlsx_sheet(wb, sheet_name)
+    for sheet_name, (headers, rows) in all_sheets.items():
 
         if sheet_name in ("annotation", "formula"):
             sheets[sheet_name] = (headers, rows)
@@ -223,46 +300,45 @@ def filter_phospho_xlsx(
 
         elif sheet_name == "contrasts":
             cn_idx = headers.index("contrast_name")
-            filtered = [r for r in rows if r[cn_idx] in keep_contrasts]
+            filtered = [r for r in rows if r[cn_idx] in contrast_set]
             sheets[sheet_name] = (headers, filtered)
 
         elif sheet_name == "diff_exp_analysis":
             site_idx = headers.index("site")
             contrast_idx = headers.index("contrast")
+            get = itemgetter(site_idx, contrast_idx)
             filtered = [
                 r for r in rows
-                if r[site_idx] in keep_sites and r[contrast_idx] in keep_contrasts
+                if (k := get(r))[0] in keep_sites and k[1] in contrast_set
             ]
             sheets[sheet_name] = (headers, filtered)
 
-        elif sheet_name in ("diff_exp_analysis_wide",
-                            "normalized_abundances",
-                            "raw_abundances_matrix",
-                            "normalized_abundances_matrix",
-                            "missing_information",
-                            "stats_normalized",
-                            "stats_normalized_wide",
-                            "stats_raw",
-                            "stats_raw_wide"):
+        elif sheet_name == "diff_exp_analysis_wide":
+            filtered, rev_count, con_count = _filter_wide(headers, rows, "site", keep_sites)
+            sheets[sheet_name] = (headers, filtered)
+
+        elif sheet_name in ID_FILTERED_SHEETS:
             site_idx = headers.index("site")
-            filtered = [r for r in rows if r[site_idx] in keep_sites]
+            get = itemgetter(site_idx)
+            filtered = [r for r in rows if get(r) in keep_sites]
             sheets[sheet_name] = (headers, filtered)
 
         else:
             sheets[sheet_name] = (headers, rows)
 
-    _update_summary(sheets)
+    _update_summary(sheets, rev_count, con_count)
     return sheets
 
 
 def filter_protein_xlsx(
-    wb: openpyxl.Workbook, keep_proteins: set, keep_contrasts: list[str]
+    all_sheets: dict[str, tuple[list, list[list]]], keep_proteins: set, keep_contrasts: list[str]
 ) -> dict[str, tuple[list, list[list]]]:
     """Filter all protein xlsx sheets."""
+    contrast_set = frozenset(keep_contrasts)
     sheets = {}
+    rev_count = con_count = 0
 
-    for sheet_name in wb.sheetnames:
-        headers, rows = read_xlsx_sheet(wb, sheet_name)
+    for sheet_name, (headers, rows) in all_sheets.items():
 
         if sheet_name in ("annotation", "formula"):
             sheets[sheet_name] = (headers, rows)
@@ -272,35 +348,33 @@ def filter_protein_xlsx(
 
         elif sheet_name == "contrasts":
             cn_idx = headers.index("contrast_name")
-            filtered = [r for r in rows if r[cn_idx] in keep_contrasts]
+            filtered = [r for r in rows if r[cn_idx] in contrast_set]
             sheets[sheet_name] = (headers, filtered)
 
         elif sheet_name == "diff_exp_analysis":
             prot_idx = headers.index("protein_Id")
             contrast_idx = headers.index("contrast")
+            get = itemgetter(prot_idx, contrast_idx)
             filtered = [
                 r for r in rows
-                if r[prot_idx] in keep_proteins and r[contrast_idx] in keep_contrasts
+                if (k := get(r))[0] in keep_proteins and k[1] in contrast_set
             ]
             sheets[sheet_name] = (headers, filtered)
 
-        elif sheet_name in ("diff_exp_analysis_wide",
-                            "normalized_abundances",
-                            "raw_abundances_matrix",
-                            "normalized_abundances_matrix",
-                            "missing_information",
-                            "stats_normalized",
-                            "stats_normalized_wide",
-                            "stats_raw",
-                            "stats_raw_wide"):
+        elif sheet_name == "diff_exp_analysis_wide":
+            filtered, rev_count, con_count = _filter_wide(headers, rows, "protein_Id", keep_proteins)
+            sheets[sheet_name] = (headers, filtered)
+
+        elif sheet_name in ID_FILTERED_SHEETS:
             prot_idx = headers.index("protein_Id")
-            filtered = [r for r in rows if r[prot_idx] in keep_proteins]
+            get = itemgetter(prot_idx)
+            filtered = [r for r in rows if get(r) in keep_proteins]
             sheets[sheet_name] = (headers, filtered)
 
         else:
             sheets[sheet_name] = (headers, rows)
 
-    _update_summary(sheets)
+    _update_summary(sheets, rev_count, con_count)
     return sheets
 
 
@@ -311,13 +385,23 @@ def filter_protein_xlsx(
 def filter_parquet(
     src_path: Path, dest_path: Path, filter_col: str, keep_values: set
 ):
-    """Filter a parquet file to rows where filter_col is in keep_values."""
+    """Filter a parquet file to rows where filter_col is in keep_values.
+
+    Returns (n_rows_in, n_rows_out).
+    """
     table = pq.read_table(src_path)
     col = table.column(filter_col)
-    mask = pa.array([v.as_py() in keep_values for v in col])
+    # Membership test runs inside Arrow, without boxing every value
+    mask = pc.is_in(col, value_set=pa.array(list(keep_values), type=col.type))
     filtered = table.filter(mask)
-    pq.write_table(filtered, dest_path)
-    print(f"  Parquet {src_path.name}: {len(table)} -> {len(filtered)} rows")
+    # Subsets are small: one row group, dictionary-encoded, zstd-compressed
+    pq.write_table(
+        filtered, dest_path,
+        row_group_size=max(1024, len(filtered)),
+        compression="zstd",
+        use_dictionary=True,
+    )
+    return len(table), len(filtered)
 
 
 # ---------------------------------------------------------------------------
@@ -332,26 +416,31 @@ def filter_annotation_tsv(
     1. ContrastName/Contrast format: set unwanted contrasts to NA
     2. Group/Control format (no ContrastName): copy as-is
     """
-    with open(src_path, newline="") as f:
-        reader = csv.DictReader(f, delimiter="\t")
+    # Stream rows from source to destination instead of loading the file
+    with open(src_path, newline="") as src, open(dest_path, "w", newline="") as dest:
+        reader = csv.DictReader(src, delimiter="\t")
         fieldnames = reader.fieldnames
-        rows = list(reader)
-
-    has_contrast_name = "ContrastName" in fieldnames
-
-    with open(dest_path, "w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames, delimiter="\t")
+        has_contrast_name = "ContrastName" in fieldnames
+        contrast_set = (
+            frozenset(keep_contrasts)
+            if has_contrast_name and keep_contrasts is not None
+            else None
+        )
+
+        writer = csv.DictWriter(dest, fieldnames=fieldnames, delimiter="\t")
         writer.writeheader()
-        for row in rows:
-            if has_contrast_name and keep_contrasts is not None:
+        n_rows = 0
+        for row in reader:
+            if contrast_set is not None:
                 cn = row.get("ContrastName", "").strip()
-                if cn and cn != "NA" and cn not in keep_contrasts:
+                if cn and cn != "NA" and cn not in contrast_set:
                     row["ContrastName"] = "NA"
                     row["Contrast"] = "NA"
             writer.writerow(row)
+            n_rows += 1
 
     fmt = "ContrastName/Contrast" if has_contrast_name else "Group/Control"
-    print(f"  {src_path.name}: {len(rows)} rows ({fmt} format)")
+    print(f"  {src_path.name}: {n_rows} rows ({fmt} format)")
 
 
 # ---------------------------------------------------------------------------
@@ -385,20 +474,26 @@ def run_subset(cfg: dict):
     phospho_xlsx_path = src_dir / cfg["phospho_dea"] / cfg["phospho_res"] / cfg["phospho_xlsx"]
     protein_xlsx_path = src_dir / cfg["protein_dea"] / cfg["protein_res"] / cfg["protein_xlsx"]
 
-    # Step 1: Select phosphosites (from diff_exp_analysis, contrast-aware)
+    # Each workbook is parsed once; selection and filtering use the sheets in memory
     print("Loading xlsx files...")
-    phospho_wb = openpyxl.load_workbook(phospho_xlsx_path, read_only=True)
+    # The protein workbook is read from disk while the phospho one is parsed
+    _prefetch(phospho_xlsx_path, protein_xlsx_path)
+    phospho_wb = openpyxl.load_workbook(phospho_xlsx_path, read_only=True, data_only=True)
+    phospho_all = load_all_sheets(phospho_wb)
+    phospho_wb.close()
+    protein_wb = openpyxl.load_workbook(protein_xlsx_path, read_only=True, data_only=True)
+    protein_all = load_all_sheets(protein_wb)
+    protein_wb.close()
+
+    # Step 1: Select phosphosites (from diff_exp_analysis, contrast-aware)
     print("\n--- Selecting phosphosites ---")
     keep_sites, phospho_proteins = select_phosphosites(
-        phospho_wb, cfg["n_phospho"], cfg["keep_contrasts"],
+        phospho_all, cfg["n_phospho"], cfg["keep_contrasts"],
     )
-    phospho_wb.close()
 
     # Step 2: Select proteins (all matching phospho proteins)
     print("\n--- Selecting proteins ---")
-    protein_wb = openpyxl.load_workbook(protein_xlsx_path, read_only=True)
-    keep_proteins = select_proteins(protein_wb, phospho_proteins)
-    protein_wb.close()
+    keep_proteins = select_proteins(protein_all, phospho_proteins)
 
     # Clean and create output directories
     if out_dir.exists():
@@ -413,9 +508,7 @@ def run_subset(cfg: dict):
 
     # Step 3: Filter and write phospho xlsx
     print("\n--- Filtering phospho xlsx ---")
-    phospho_wb = openpyxl.load_workbook(phospho_xlsx_path, read_only=True)
-    phospho_sheets = filter_phospho_xlsx(phospho_wb, keep_sites, cfg["keep_contrasts"])
-    phospho_wb.close()
+    phospho_sheets = filter_phospho_xlsx(phospho_all, keep_sites, cfg["keep_contrasts"])
     write_xlsx(phospho_sheets, phospho_res_out / cfg["phospho_xlsx"])
     print(f"  Wrote {phospho_res_out / cfg['phospho_xlsx']}")
     for name, (_, rows) in phospho_sheets.items():
@@ -423,28 +516,27 @@ def run_subset(cfg: dict):
 
     # Step 4: Filter and write protein xlsx
     print("\n--- Filtering protein xlsx ---")
-    protein_wb = openpyxl.load_workbook(protein_xlsx_path, read_only=True)
-    protein_sheets = filter_protein_xlsx(protein_wb, keep_proteins, cfg["keep_contrasts"])
-    protein_wb.close()
+    protein_sheets = filter_protein_xlsx(protein_all, keep_proteins, cfg["keep_contrasts"])
     write_xlsx(protein_sheets, protein_res_out / cfg["protein_xlsx"])
     print(f"  Wrote {protein_res_out / cfg['protein_xlsx']}")
     for name, (_, rows) in protein_sheets.items():
         print(f"    {name}: {len(rows)} rows")
 
     # Step 5: Filter parquet files
+    # Arrow releases the GIL while reading, filtering and writing, so the
+    # two files are processed concurrently
     print("\n--- Filtering parquet files ---")
-    filter_parquet(
-        src_dir / cfg["phospho_dea"] / cfg["phospho_res"] / "lfqdata_normalized.parquet",
-        phospho_res_out / "lfqdata_normalized.parquet",
-        "site",
-        keep_sites,
-    )
-    filter_parquet(
-        src_dir / cfg["protein_dea"] / cfg["protein_res"] / "lfqdata_normalized.parquet",
-        protein_res_out / "lfqdata_normalized.parquet",
-        "protein_Id",
-        keep_proteins,
-    )
+    parquet_jobs = [
+        (src_dir / cfg["phospho_dea"] / cfg["phospho_res"] / "lfqdata_normalized.parquet",
+         phospho_res_out / "lfqdata_normalized.parquet", "site", keep_sites),
+        (src_dir / cfg["protein_dea"] / cfg["protein_res"] / "lfqdata_normalized.parquet",
+         protein_res_out / "lfqdata_normalized.parquet", "protein_Id", keep_proteins),
+    ]
+    with ThreadPoolExecutor(max_workers=len(parquet_jobs)) as pool:
+        futures = [pool.submit(filter_parquet, *job) for job in parquet_jobs]
+        for (src_path, *_), future in zip(parquet_jobs, futures):
+            n_in, n_out = future.result()
+            print(f"  Parquet {src_path.name}: {n_in} -> {n_out} rows")
 
     # Step 6: Copy lfqdata.yaml files
     print("\n--- Copying lfqdata.yaml files ---")